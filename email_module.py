@@ -1,5 +1,8 @@
 import os
+import shutil
+import tempfile
 import pandas as pd
+import pywintypes
 import win32com.client
 from typing import List, Optional, Dict, Union
 from io import BytesIO
@@ -51,15 +54,6 @@ def email_reports(
         Success status
     """
     # Load email recipients
-    try:
-        emails_df = pd.read_csv(email_csv)
-    except FileNotFoundError:
-        log_message("Error: emails.csv not found. Cannot send emails.", 1, verbosity)
-        return False
-    except Exception as e:
-        log_message(f"Error reading emails.csv: {e}", 1, verbosity)
-        return False
-    
     recipients = load_email_recipients(email_csv)
     
     if not recipients:
@@ -70,6 +64,30 @@ def email_reports(
         log_message("Delete-after-send enabled: sent Outlook messages will be removed from Sent Items.", 2, verbosity)
     # Get today's date for the email subject
     today = datetime.today().strftime("%B %d, %Y")
+
+    # Recipient lists and email bodies only vary by region, so build them once up front
+    to_by_region = {region: ';'.join(emails) for region, emails in recipients.items()}
+    alerts_body = f"""
+    <p>Hello,</p>
+    <p>Attached is the Automated Traffic Signal Performance Measures report for {{region}} dated {today}.</p>
+    <p>Please review the findings and address any issues identified in the report.</p>
+    <p><br>NEW ALERT ADDED: Skipped Phases - When more than a couple skipped phases are detected in the past week, an alert is generated. Remember that this alert is only shown for NEW issues, so you will only see an alert for a given phase once.</p>
+    <p><br><i>Note: This is an automated email generated by ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
+    <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
+    """
+    no_alerts_body = f"""
+    <p>Hello,</p>
+    <p>Good news! The Automated Traffic Signal Performance Measures analysis for {{region}} dated {today} found no new issues to report.</p>
+    <p>All traffic signals in your region are operating within normal parameters. No action is required at this time.</p>
+    <p><br><i>Note: This is an automated email generated by ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
+    <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
+    """
+    no_report_body = f"""
+    <p>Good news, ATSPM Report for {{region}} {today} found no new issues!</p>
+
+    <p><br><br><i>Note: This is an automated email generated by the open source ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
+    <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
+    """
     
     try:
         # Create Outlook application object
@@ -78,89 +96,72 @@ def email_reports(
         # Track success
         all_success = True
         
-        # First, handle regions that have reports (regions with alerts)
-        for i, region in enumerate(regions):
-            if region not in recipients:
-                log_message(f"No email recipient found for {region}. Skipping.", 1, verbosity)
-                all_success = False
-                continue
+        # Attachments for in-memory reports are written to one temporary directory
+        temp_dir = tempfile.mkdtemp() if report_in_memory else None
+        try:
+            # First, handle regions that have reports (regions with alerts)
+            for i, region in enumerate(regions):
+                if region not in recipients:
+                    log_message(f"No email recipient found for {region}. Skipping.", 1, verbosity)
+                    all_success = False
+                    continue
                 
-            # Check if this region has alerts
-            has_alerts = regions_with_alerts is None or region in regions_with_alerts
+                # Check if this region has alerts
+                has_alerts = regions_with_alerts is None or region in regions_with_alerts
             
-            # Create a new email
-            mail = outlook.CreateItem(0)  # 0 corresponds to olMailItem
-            if delete_sent_emails:
-                mail.DeleteAfterSubmit = True
+                # Create a new email
+                mail = outlook.CreateItem(0)  # 0 corresponds to olMailItem
+                if delete_sent_emails:
+                    mail.DeleteAfterSubmit = True
             
-            mail.Subject = f"ATSPM Report - {region} - {today}"
+                mail.Subject = f"ATSPM Report - {region} - {today}"
             
-            # Join all email addresses for the region into a single TO field
-            mail.To = ';'.join(recipients[region])
+                mail.To = to_by_region[region]
             
-            # Set email body based on whether there are alerts
-            if has_alerts:
-                # Email body for regions with alerts
-                mail.HTMLBody = f"""
-                <p>Hello,</p>
-                <p>Attached is the Automated Traffic Signal Performance Measures report for {region} dated {today}.</p>
-                <p>Please review the findings and address any issues identified in the report.</p>
-                <p><br>NEW ALERT ADDED: Skipped Phases - When more than a couple skipped phases are detected in the past week, an alert is generated. Remember that this alert is only shown for NEW issues, so you will only see an alert for a given phase once.</p>
-                <p><br><i>Note: This is an automated email generated by ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
-                <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
-                """
-            else:
-                # Email body for regions with no alerts
-                mail.HTMLBody = f"""
-                <p>Hello,</p>
-                <p>Good news! The Automated Traffic Signal Performance Measures analysis for {region} dated {today} found no new issues to report.</p>
-                <p>All traffic signals in your region are operating within normal parameters. No action is required at this time.</p>
-                <p><br><i>Note: This is an automated email generated by ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
-                <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
-                """            
-            # Attachment handling depends on whether report is in memory or on disk and whether there are alerts
-            if has_alerts:
-                # Only attach reports for regions with alerts
-                if report_in_memory:
-                    # Reports are in memory as BytesIO objects
-                    buffer = region_reports[i]
-                    buffer.seek(0)  # Ensure we're at the beginning of the buffer
-                    
-                    # Create a temporary file to attach
-                    temp_path = f"ATSPM_report_{region.replace(' ', '_')}.pdf"
-                    with open(temp_path, 'wb') as f:
-                        f.write(buffer.getvalue())
+                # Set email body based on whether there are alerts
+                mail.HTMLBody = (alerts_body if has_alerts else no_alerts_body).format(region=region)
+                # Attachment handling depends on whether report is in memory or on disk and whether there are alerts
+                if has_alerts:
+                    # Only attach reports for regions with alerts
+                    if report_in_memory:
+                        # Reports are in memory as BytesIO objects
+                        buffer = region_reports[i]
+                        buffer.seek(0)  # Ensure we're at the beginning of the buffer
                     
-                    # Add the attachment
-                    mail.Attachments.Add(os.path.abspath(temp_path))
+                        # Write the report into the shared temporary directory to attach it
+                        temp_path = os.path.join(temp_dir, f"ATSPM_report_{region.replace(' ', '_')}.pdf")
+                        with open(temp_path, 'wb') as f:
+                            f.write(buffer.getbuffer())
                     
-                    # Send the email
-                    mail.Send()
-                    
-                    # Clean up temporary file
-                    try:
-                        os.remove(temp_path)
-                    except Exception as e:
-                        log_message(f"Warning: Could not remove temporary file {temp_path}: {e}", 1, verbosity)
-                else:
-                    # Reports are on disk
-                    report_path = region_reports[i]
+                        # Add the attachment
+                        mail.Attachments.Add(temp_path)
                     
-                    # Add the attachment if file exists
-                    if os.path.exists(report_path):
-                        mail.Attachments.Add(os.path.abspath(report_path))
+                        # Send the email
                         mail.Send()
                     else:
-                        log_message(f"Error: Report file not found at {report_path}", 1, verbosity)
-                        all_success = False
-            else:
-                # For regions with no alerts, just send the email without attachment
-                mail.Send()
+                        # Reports are on disk
+                        report_path = region_reports[i]
+                    
+                        # Add the attachment; Outlook raises a COM error if the file is missing
+                        try:
+                            mail.Attachments.Add(os.path.abspath(report_path))
+                        except pywintypes.com_error:
+                            log_message(f"Error: Report file not found at {report_path}", 1, verbosity)
+                            all_success = False
+                        else:
+                            mail.Send()
+                else:
+                    # For regions with no alerts, just send the email without attachment
+                    mail.Send()
             
-            if has_alerts:
-                log_message(f"Report for {region} sent to {recipients[region]}", 1, verbosity)
-            else:
-                log_message(f"No-alerts notification for {region} sent to {recipients[region]}", 1, verbosity)
+                if has_alerts:
+                    log_message(f"Report for {region} sent to {recipients[region]}", 1, verbosity)
+                else:
+                    log_message(f"No-alerts notification for {region} sent to {recipients[region]}", 1, verbosity)
+        finally:
+            if temp_dir is not None:
+                # Outlook can still hold an attached PDF open; a leftover temp file must not fail the run
+                shutil.rmtree(temp_dir, ignore_errors=True)
         
         # Now handle any regions that have email recipients but no reports
         if regions_with_alerts is not None:
@@ -182,15 +183,10 @@ def email_reports(
                 if delete_sent_emails:
                     mail.DeleteAfterSubmit = True
                 mail.Subject = f"ATSPM Report - {region} - {today} - No Issues Found"
-                mail.To = ';'.join(recipients[region])
+                mail.To = to_by_region[region]
                 
                 # Email body for regions with no alerts
-                mail.HTMLBody = f"""
-                <p>Good news, ATSPM Report for {region} {today} found no new issues!</p>
-          
-                <p><br><br><i>Note: This is an automated email generated by the open source ATSPM Report, source code available on <a href="https://github.com/ShawnStrasser/atspm-report">GitHub</a>.</i></p>
-                <p>Please review the list of recipients for your region and reply to this email to add or remove anyone. Thanks!</p>
-                """
+                mail.HTMLBody = no_report_body.format(region=region)
                 
                 # Send the email without attachment
                 mail.Send()
@@ -1,21 +1,27 @@
 import ibis
 import pandas as pd
 import ibis.expr.types as ir
-from typing import Union, Tuple
-from datetime import date, timedelta
+from typing import List, Optional, Union, Tuple
 from .statistical_analysis import cusum, alert
 
-def _to_ibis(data: Union[pd.DataFrame, ir.Table]) -> Tuple[ir.Table, bool]:
+MAXOUT_COLUMNS = ['TimeStamp', 'DeviceId', 'Phase', 'PerformanceMeasure', 'Total']
+ACTUATIONS_COLUMNS = ['TimeStamp', 'DeviceId', 'Detector', 'Total', 'anomaly', 'prediction']
+HAS_DATA_COLUMNS = ['TimeStamp', 'DeviceId']
+PED_COLUMNS = ['TimeStamp', 'DeviceId', 'Phase', 'PedServices', 'PedActuation']
+
+def _to_ibis(data: Union[pd.DataFrame, ir.Table], columns: Optional[List[str]] = None) -> Tuple[ir.Table, bool]:
     if isinstance(data, pd.DataFrame):
+        # Only hand the backend the columns the queries read; extra columns would
+        # otherwise be converted along with the rest when the memtable is registered
+        if columns is not None and set(columns) < set(data.columns):
+            data = data[columns]
         return ibis.memtable(data), True
     return data, False
 
 def process_maxout_data(df: Union[pd.DataFrame, ir.Table]):
     """Process the max out data to calculate daily aggregates"""
-    ibis.options.interactive = True
-    
     # Convert to Ibis table
-    t, is_pandas = _to_ibis(df)
+    t, is_pandas = _to_ibis(df, MAXOUT_COLUMNS)
     
     # Daily aggregates
     t_daily = t.mutate(Date=t['TimeStamp'].cast('date'))
@@ -62,10 +68,8 @@ def process_maxout_data(df: Union[pd.DataFrame, ir.Table]):
 
 def process_actuations_data(df: Union[pd.DataFrame, ir.Table]):
     """Process the actuations data to calculate daily aggregates"""
-    ibis.options.interactive = True
-    
     # Convert to Ibis table
-    t, is_pandas = _to_ibis(df)
+    t, is_pandas = _to_ibis(df, ACTUATIONS_COLUMNS)
     
     # Daily aggregates
     t_daily = t.mutate(Date=t['TimeStamp'].cast('date'))
@@ -95,25 +99,20 @@ def process_actuations_data(df: Union[pd.DataFrame, ir.Table]):
 def process_missing_data(has_data_df: Union[pd.DataFrame, ir.Table]):
     """Process the missing data to calculate daily percent missing data"""
     # Convert to Ibis table
-    ibis.options.interactive = True
-    has_data_table, is_pandas = _to_ibis(has_data_df)
+    has_data_table, is_pandas = _to_ibis(has_data_df, HAS_DATA_COLUMNS)
     
     # Extract the date from the TimeStamp
     has_data_table = has_data_table.mutate(Date=has_data_table['TimeStamp'].date())
     
-    # Get min/max dates
-    # We execute here to get python values for the loop below
-    min_max_dates = has_data_table.aggregate(
-        MinDate=has_data_table.Date.min(),
-        MaxDate=has_data_table.Date.max()
-    ).execute()
-    
-    min_date_val = min_max_dates['MinDate'][0]
-    max_date_val = min_max_dates['MaxDate'][0]
-    
-    # Generate complete date range
-    date_list = [min_date_val + timedelta(days=i) for i in range((max_date_val - min_date_val).days + 1)]
-    all_dates_table = ibis.memtable({"Date": date_list})
+    # Generate the complete date range in the backend, so nothing is executed eagerly
+    date_bounds = has_data_table.aggregate(
+        MinDate=has_data_table.Date.min().cast('timestamp'),
+        MaxDate=has_data_table.Date.max().cast('timestamp')
+    )
+    one_day = ibis.interval(days=1)
+    all_dates_table = date_bounds.select(
+        Date=ibis.range(date_bounds.MinDate, date_bounds.MaxDate + one_day, one_day).unnest().cast('date')
+    )
     
     # Get distinct devices
     distinct_devices = has_data_table[['DeviceId']].distinct()
@@ -149,10 +148,8 @@ def process_ped(df_ped: Union[pd.DataFrame, ir.Table],
                 df_maxout: Union[pd.DataFrame, ir.Table], 
                 df_intersections: Union[pd.DataFrame, ir.Table]):
     """Process the max out data to calculate daily aggregates"""
-    ibis.options.interactive = True
-    
     # Convert to Ibis tables
-    ped, is_ped_pd = _to_ibis(df_ped)
+    ped, is_ped_pd = _to_ibis(df_ped, PED_COLUMNS)
     maxout, is_maxout_pd = _to_ibis(df_maxout)
     intersections, is_int_pd = _to_ibis(df_intersections)
     
@@ -273,13 +270,15 @@ def process_ped(df_ped: Union[pd.DataFrame, ir.Table],
     # Distinct devices/phases
     devices_phases = t1_hourly.select('DeviceId', 'Phase').distinct()
     
-    # Time series
-    min_time = t1_hourly['TimeStamp'].min().execute()
-    max_time = t1_hourly['TimeStamp'].max().execute()
-    
-    # Generate hourly timestamps
-    date_range = pd.date_range(start=min_time, end=max_time, freq='h')
-    time_series = ibis.memtable({'TimeStamp': date_range})
+    # Generate hourly timestamps in the backend, so nothing is executed eagerly
+    time_bounds = t1_hourly.aggregate(
+        MinTime=t1_hourly['TimeStamp'].min(),
+        MaxTime=t1_hourly['TimeStamp'].max()
+    )
+    one_hour = ibis.interval(hours=1)
+    time_series = time_bounds.select(
+        TimeStamp=ibis.range(time_bounds.MinTime, time_bounds.MaxTime + one_hour, one_hour).unnest()
+    )
     
     scaffold = time_series.cross_join(devices_phases)
     
@@ -3,6 +3,8 @@
 from typing import Optional, Dict, Union
 import pandas as pd
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,11 +18,33 @@ from .data_processing import (
     process_ped
 )
 from .statistical_analysis import cusum, alert
-from .visualization import create_device_plots, create_phase_skip_plots
-from .report_generation import generate_pdf_report
 from .phase_skip_processing import process_phase_wait_data
 from .utils import log_message
 
+# Plotting and PDF helpers pull in matplotlib and reportlab, which dominate import
+# time, so they are imported on first use (see __getattr__ below)
+_LAZY_REPORT_IMPORTS = {
+    'create_device_plots': '.visualization',
+    'create_phase_skip_plots': '.visualization',
+    'generate_pdf_report': '.report_generation',
+}
+
+
+def __getattr__(name: str):
+    """Import a lazily loaded report helper and cache it as a module global."""
+    if name in _LAZY_REPORT_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_REPORT_IMPORTS[name], __package__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _import_report_helpers() -> None:
+    """Make sure the plotting and PDF helpers are bound before they are called."""
+    for name in _LAZY_REPORT_IMPORTS:
+        if name not in globals():
+            __getattr__(name)
+
 
 def _is_empty(data: Union[pd.DataFrame, ir.Table, None]) -> bool:
     """Check if data is None or empty, works for both pandas and Ibis."""
@@ -29,8 +53,9 @@ def _is_empty(data: Union[pd.DataFrame, ir.Table, None]) -> bool:
     if isinstance(data, pd.DataFrame):
         return data.empty
     if isinstance(data, ir.Table):
-        # For Ibis tables, check if there are any rows
-        return data.count().execute() == 0
+        # For Ibis tables, only look for a first row; a full count would scan the whole
+        # source (e.g. every file behind read_parquet) before any processing starts
+        return data.limit(1).count().execute() == 0
     return True
 
 
@@ -50,15 +75,21 @@ def _get_shape_str(data: Union[pd.DataFrame, ir.Table]) -> str:
     return "unknown"
 
 
+def _has_string_dtype(series: pd.Series) -> bool:
+    """True for pandas/Arrow string dtypes; object columns are not assumed to hold strings."""
+    return series.dtype != object and pd.api.types.is_string_dtype(series.dtype)
+
+
 def _normalize_deviceid(data: Union[pd.DataFrame, ir.Table, None]) -> Union[pd.DataFrame, ir.Table, None]:
     """Convert DeviceId column to string type if present, works for both pandas and Ibis."""
     if data is None:
         return None
     
     if isinstance(data, pd.DataFrame):
-        if 'DeviceId' in data.columns:
-            data = data.copy()
-            data['DeviceId'] = data['DeviceId'].astype(str)
+        # Dedicated string dtypes (e.g. Arrow-backed frames) are already normalized, and
+        # keeping them avoids an object-column copy the backend would have to re-scan
+        if 'DeviceId' in data.columns and not _has_string_dtype(data['DeviceId']):
+            data = data.assign(DeviceId=data['DeviceId'].astype(str))
         return data
     
     if isinstance(data, ir.Table):
@@ -70,6 +101,88 @@ def _normalize_deviceid(data: Union[pd.DataFrame, ir.Table, None]) -> Union[pd.D
     return data
 
 
+def _as_naive_datetime(dates: pd.Series, errors: str = 'raise') -> pd.Series:
+    """Parse to datetimes and drop any timezone, skipping both steps when not needed."""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors=errors)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates
+
+
+def _normalize_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with Date as tz-naive datetime64, without copying when it already is.
+
+    Any datetime64 resolution is kept as is; the backend returns us or s depending on
+    the alert type and pandas compares and concatenates across resolutions.
+    """
+    if 'Date' not in df.columns:
+        return df
+    dates = df['Date']
+    if pd.api.types.is_datetime64_dtype(dates.dtype):
+        return df
+    return df.assign(Date=_as_naive_datetime(dates))
+
+
+def _collect_past_alerts(
+    past_alerts: Optional[Dict[str, Union[pd.DataFrame, ir.Table]]],
+    history_start: Optional[datetime] = None
+) -> Dict[str, pd.DataFrame]:
+    """Materialize past alerts as pandas, one DataFrame per alert type, with Date normalized.
+
+    Inputs are projected to the id and Date columns first, the only columns that
+    suppression and history retention use. For Ibis tables (e.g. ``con.read_parquet(...)``)
+    this happens before executing, so the backend only reads those columns, and rows
+    before history_start are filtered in the backend where Parquet statistics can skip them.
+    """
+    past_alerts = past_alerts or {}
+    collected = {}
+    for alert_type, config in ALERT_CONFIG.items():
+        data = past_alerts.get(alert_type)
+        required_cols = config['id_cols'] + ['Date']
+        if isinstance(data, ir.Table):
+            data = data.select(required_cols)
+            if history_start is not None and data.Date.type().is_temporal():
+                data = data.filter(data.Date >= history_start)
+            data = _normalize_deviceid(data).execute()
+        elif (isinstance(data, pd.DataFrame) and list(data.columns) != required_cols
+              and set(required_cols).issubset(data.columns)):
+            data = data[required_cols]
+        collected[alert_type] = _normalize_date(data) if data is not None else pd.DataFrame()
+    return collected
+
+
+def _compute_alerts(daily: Union[pd.DataFrame, ir.Table]) -> pd.DataFrame:
+    """Run CUSUM and alert detection on daily aggregates and return the alert rows."""
+    expr = alert(cusum(daily, k_value=1))
+    if isinstance(daily, pd.DataFrame):
+        # pandas input is a memtable, so it can run on a private DuckDB connection.
+        # The shared default connection is not safe to use from several threads.
+        con = ibis.duckdb.connect()
+        try:
+            return con.execute(expr)
+        finally:
+            con.disconnect()
+    return expr.execute()
+
+
+def _compute_alerts_concurrently(daily_by_type: Dict[str, Union[pd.DataFrame, ir.Table]]) -> Dict[str, pd.DataFrame]:
+    """Run the independent CUSUM + alert pipelines concurrently.
+
+    pandas inputs each run on their own thread and DuckDB connection. Ibis inputs stay
+    on the caller's backend and run on the calling thread meanwhile.
+    """
+    pandas_types = [t for t, daily in daily_by_type.items() if isinstance(daily, pd.DataFrame)]
+    with ThreadPoolExecutor(max_workers=max(len(pandas_types), 1)) as executor:
+        futures = {t: executor.submit(_compute_alerts, daily_by_type[t]) for t in pandas_types}
+        results = {
+            t: _compute_alerts(daily)
+            for t, daily in daily_by_type.items() if t not in futures
+        }
+        results.update({t: future.result() for t, future in futures.items()})
+    return results
+
+
 # Alert configuration
 ALERT_CONFIG = {
     'maxout': {'id_cols': ['DeviceId', 'Phase'], 'file_suffix': 'maxout_alerts'},
@@ -134,7 +247,7 @@ class ReportGenerator:
         pedestrian: Optional[Union[pd.DataFrame, ir.Table]] = None,
         phase_wait: Optional[Union[pd.DataFrame, ir.Table]] = None,
         coordination_agg: Optional[Union[pd.DataFrame, ir.Table]] = None,
-        past_alerts: Optional[Dict[str, pd.DataFrame]] = None,
+        past_alerts: Optional[Dict[str, Union[pd.DataFrame, ir.Table]]] = None,
     ) -> dict:
         """
         Generate reports from provided DataFrames or Ibis tables.
@@ -155,9 +268,10 @@ class ReportGenerator:
             coordination_agg: Coordination aggregation data with columns:
                 TimeStamp, DeviceId, ActualCycleLength
                 (15-minute bin aggregated data for cycle length plotting)
-            past_alerts: Dict of alert_type -> DataFrame for suppression.
+            past_alerts: Dict of alert_type -> DataFrame or Ibis table for suppression.
                 Keys: 'maxout', 'actuations', 'missing_data', 'pedestrian', 
                       'phase_skips', 'system_outages'
+                Ibis tables are read lazily; only the id columns and Date are loaded.
         
         Returns:
             dict with keys:
@@ -172,6 +286,12 @@ class ReportGenerator:
         # Validate required input
         if _is_empty(signals):
             raise ValueError("'signals' is required and cannot be None or empty")
+
+        # Single reference time so every cutoff in this run agrees
+        run_time = datetime.now()
+        suppression_cutoff = run_time - timedelta(days=self.config['alert_suppression_days'])
+        retention_weeks = self.config['alert_retention_weeks']
+        retention_cutoff = run_time - timedelta(weeks=retention_weeks) if retention_weeks > 0 else None
         
         # Normalize DeviceId to string in all inputs
         signals = _normalize_deviceid(signals)
@@ -184,20 +304,24 @@ class ReportGenerator:
         
         # Convert signals to pandas (needed for downstream operations)
         signals = _to_pandas(signals)
+        # One Ibis view of signals shared by every query that joins it, so the frame is
+        # registered with the backend once rather than per query
+        signals_tbl = ibis.memtable(signals)
         
         verbosity = self.config['verbosity']
         log_message("Starting signal analysis...", 1, verbosity)
         
-        # Initialize past alerts if not provided
-        if past_alerts is None:
-            past_alerts = {}
-        for alert_type in ALERT_CONFIG:
-            if alert_type not in past_alerts:
-                past_alerts[alert_type] = pd.DataFrame()
+        # Load past alerts (missing types become empty DataFrames)
+        # Past alerts older than both cutoffs are never used, so lazy inputs can skip them
+        history_start = retention_cutoff
+        if history_start is not None and self.config['suppress_repeated_alerts']:
+            history_start = min(history_start, suppression_cutoff)
+        past_alerts = _collect_past_alerts(past_alerts, history_start)
         
         # Initialize result containers
         new_alerts = {}
         hourly_data = {}
+        cusum_inputs = {}
         
         # Process maxout data if provided
         if not _is_empty(terminations):
@@ -205,10 +329,7 @@ class ReportGenerator:
             maxout_daily, maxout_hourly = process_maxout_data(terminations)
             hourly_data['maxout_hourly'] = _to_pandas(maxout_hourly)
             log_message(f"Processed max out data. Shape: {_get_shape_str(maxout_daily)}", 1, verbosity)
-            
-            log_message("Calculating CUSUM statistics for maxout...", 1, verbosity)
-            t = cusum(maxout_daily, k_value=1)
-            new_alerts['maxout'] = alert(t).execute()
+            cusum_inputs['maxout'] = maxout_daily
         else:
             new_alerts['maxout'] = pd.DataFrame()
             hourly_data['maxout_hourly'] = pd.DataFrame()
@@ -219,10 +340,7 @@ class ReportGenerator:
             detector_daily, detector_hourly = process_actuations_data(detector_health)
             hourly_data['detector_hourly'] = _to_pandas(detector_hourly)
             log_message(f"Processed actuations data. Shape: {_get_shape_str(detector_daily)}", 1, verbosity)
-            
-            log_message("Calculating CUSUM statistics for actuations...", 1, verbosity)
-            t_actuations = cusum(detector_daily, k_value=1)
-            new_alerts['actuations'] = alert(t_actuations).execute()
+            cusum_inputs['actuations'] = detector_daily
         else:
             new_alerts['actuations'] = pd.DataFrame()
             hourly_data['detector_hourly'] = pd.DataFrame()
@@ -234,12 +352,8 @@ class ReportGenerator:
             log_message(f"Processed missing data. Shape: {_get_shape_str(missing_data)}", 1, verbosity)
             
             # Filter out dates with system-wide missing data
-            ibis.options.interactive = True
-            signal_count = len(signals) * 0.30
-            
             # Convert to ibis tables
             missing_data_tbl = ibis.memtable(missing_data)
-            signals_tbl = ibis.memtable(signals)
             
             # Join and filter
             md_with_region = missing_data_tbl.join(
@@ -247,29 +361,13 @@ class ReportGenerator:
                 missing_data_tbl.DeviceId == signals_tbl.DeviceId
             )
             
-            # Find dates/regions where average missing data < 0.3
-            valid_date_regions = md_with_region.group_by(['Date', 'Region']).aggregate(
-                avg_missing=md_with_region.MissingData.mean()
-            ).filter(lambda t: t.avg_missing < 0.3)
+            # Average missing data per date/region, attached to each row with a window
+            # so the valid rows can be kept without joining back through signals
+            region_avg = md_with_region.MissingData.mean().over(group_by=['Date', 'Region'])
             
-            # Get all devices for those valid date/regions
-            valid_combos = valid_date_regions.join(
-                signals_tbl,
-                valid_date_regions.Region == signals_tbl.Region
-            ).select(
-                Date=valid_date_regions.Date,
-                DeviceId=signals_tbl.DeviceId
-            )
-            
-            # Filter missing_data to keep only valid combinations
-            missing_data_filtered = missing_data_tbl.join(
-                valid_combos,
-                [missing_data_tbl.DeviceId == valid_combos.DeviceId,
-                 missing_data_tbl.Date == valid_combos.Date]
-            ).select(
-                DeviceId=missing_data_tbl.DeviceId,
-                Date=missing_data_tbl.Date,
-                MissingData=missing_data_tbl.MissingData
+            # Keep only rows from dates/regions where average missing data < 0.3
+            missing_data_filtered = md_with_region.filter(region_avg < 0.3).select(
+                'DeviceId', 'Date', 'MissingData'
             ).order_by(['Date', 'DeviceId']).execute()
 
             # Get system outages (dates/regions where avg missing data >= 0.3)
@@ -277,21 +375,24 @@ class ReportGenerator:
                 MissingData=md_with_region.MissingData.mean()
             ).filter(lambda t: t.MissingData >= 0.3).order_by(['Date', 'Region']).execute()
             
-            log_message("Calculating CUSUM statistics for missing data...", 1, verbosity)
-            t_missing_data = cusum(missing_data_filtered, k_value=1)
-            new_alerts['missing_data'] = alert(t_missing_data).execute()
+            cusum_inputs['missing_data'] = missing_data_filtered
             new_alerts['system_outages'] = system_outages
         else:
             new_alerts['missing_data'] = pd.DataFrame()
             new_alerts['system_outages'] = pd.DataFrame()
         
+        # The CUSUM + alert pipelines are independent, so run them concurrently
+        if cusum_inputs:
+            log_message(f"Calculating CUSUM statistics for {', '.join(cusum_inputs)}...", 1, verbosity)
+            new_alerts.update(_compute_alerts_concurrently(cusum_inputs))
+
         # Process pedestrian data if provided
         if not _is_empty(pedestrian) and not _is_empty(terminations):
             log_message("Processing pedestrian data...", 1, verbosity)
-            ped_alerts, ped_hourly = process_ped(df_ped=pedestrian, df_maxout=maxout_daily, df_intersections=signals)
+            ped_alerts, ped_hourly = process_ped(df_ped=pedestrian, df_maxout=maxout_daily, df_intersections=signals_tbl)
             new_alerts['pedestrian'] = _to_pandas(ped_alerts)
             hourly_data['ped_hourly'] = _to_pandas(ped_hourly)
-            log_message(f"Processed pedestrian data. Shape: {_get_shape_str(ped_alerts)}", 1, verbosity)
+            log_message(f"Processed pedestrian data. Shape: {new_alerts['pedestrian'].shape}", 1, verbosity)
         else:
             new_alerts['pedestrian'] = pd.DataFrame()
             hourly_data['ped_hourly'] = pd.DataFrame()
@@ -305,19 +406,29 @@ class ReportGenerator:
                 coordination_agg
             )
             
-            # Convert to pandas for downstream processing
-            phase_skip_waits_pd = _to_pandas(phase_skip_waits)
-            phase_skip_alert_rows_pd = _to_pandas(phase_skip_alert_rows)
-            cycle_length_data_pd = _to_pandas(cycle_length_data)
-            
-            # Apply retention to phase skip alert rows
-            if self.config['phase_skip_retention_days'] > 0 and 'Date' in phase_skip_alert_rows_pd.columns:
-                cutoff_datetime = (
-                    datetime.now() - timedelta(days=self.config['phase_skip_retention_days'])
+            # Apply retention to phase skip alert rows in the backend when Date is a naive
+            # timestamp, so expired rows are never transferred to pandas
+            retention_cutoff_datetime = None
+            if self.config['phase_skip_retention_days'] > 0:
+                retention_cutoff_datetime = (
+                    run_time - timedelta(days=self.config['phase_skip_retention_days'])
                 ).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+                date_type = phase_skip_alert_rows.Date.type()
+                if date_type.is_timestamp() and date_type.timezone is None:
+                    phase_skip_alert_rows = phase_skip_alert_rows.filter(
+                        phase_skip_alert_rows.Date >= retention_cutoff_datetime
+                    )
+                    retention_cutoff_datetime = None
+
+            # Convert alert rows to pandas for downstream processing. Phase waits and cycle
+            # lengths are only plotted for alerting devices, so they stay lazy until then.
+            phase_skip_alert_rows_pd = _to_pandas(phase_skip_alert_rows)
+
+            # Otherwise (tz-aware or untyped Date) apply it in pandas
+            if retention_cutoff_datetime is not None and 'Date' in phase_skip_alert_rows_pd.columns:
                 # Coerce to pandas datetime for robust comparisons, including empty frames.
-                phase_skip_dates = pd.to_datetime(phase_skip_alert_rows_pd['Date'], errors='coerce').dt.tz_localize(None)
-                phase_skip_alert_rows_pd = phase_skip_alert_rows_pd[phase_skip_dates >= cutoff_datetime]
+                phase_skip_dates = _as_naive_datetime(phase_skip_alert_rows_pd['Date'], errors='coerce')
+                phase_skip_alert_rows_pd = phase_skip_alert_rows_pd[phase_skip_dates >= retention_cutoff_datetime]
             
             # Summarize and generate alerts
             phase_skip_summary, phase_skip_alert_candidates = self._summarize_phase_skip_alerts(
@@ -327,11 +438,12 @@ class ReportGenerator:
             new_alerts['phase_skips'] = phase_skip_alert_candidates
             
             # Store for report generation
-            self.phase_skip_waits = phase_skip_waits_pd
+            self.phase_skip_waits = pd.DataFrame()
             self.phase_skip_all_rows = phase_skip_alert_rows_pd
             self.phase_skip_summary = phase_skip_summary
-            self.cycle_length_data = cycle_length_data_pd
+            self.cycle_length_data = pd.DataFrame()
         else:
+            phase_skip_waits = cycle_length_data = None
             new_alerts['phase_skips'] = pd.DataFrame()
             self.phase_skip_waits = pd.DataFrame()
             self.phase_skip_all_rows = pd.DataFrame()
@@ -340,14 +452,16 @@ class ReportGenerator:
         
         # Filter new alerts to only recent ones (alert_flagging_days)
         log_message(f"Filtering newly generated alerts to the last {self.config['alert_flagging_days']} days...", 1, verbosity)
-        flagging_cutoff_date = datetime.now() - timedelta(days=self.config['alert_flagging_days'])
+        flagging_cutoff_date = run_time - timedelta(days=self.config['alert_flagging_days'])
         # Normalize to beginning of day for proper comparison with date-only columns
         flagging_cutoff_date_naive = flagging_cutoff_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
         
+        # Normalize Date once here; suppression and history updates rely on it
+        new_alerts = {alert_type: _normalize_date(df) for alert_type, df in new_alerts.items()}
         recent_new_alerts = {}
         for alert_type, df in new_alerts.items():
             if not df.empty and 'Date' in df.columns:
-                recent_new_alerts[alert_type] = df[df['Date'] >= flagging_cutoff_date_naive].copy()
+                recent_new_alerts[alert_type] = df[df['Date'] >= flagging_cutoff_date_naive]
             else:
                 recent_new_alerts[alert_type] = df
         
@@ -360,7 +474,7 @@ class ReportGenerator:
                     final_alerts[alert_type] = self._suppress_alerts(
                         recent_new_alerts[alert_type],
                         past_alerts.get(alert_type, pd.DataFrame()),
-                        self.config['alert_suppression_days'],
+                        suppression_cutoff,
                         ALERT_CONFIG[alert_type]['id_cols'],
                         verbosity
                     )
@@ -372,6 +486,7 @@ class ReportGenerator:
         
         # Generate visualizations
         log_message("Creating visualization plots...", 1, verbosity)
+        _import_report_helpers()
         num_figures = self.config['figures_per_device']
         
         phase_figures = create_device_plots(final_alerts['maxout'], signals, num_figures, 
@@ -397,17 +512,23 @@ class ReportGenerator:
             
             # Prepare data for plotting
             phase_skip_alert_pairs = final_alerts['phase_skips'][['DeviceId', 'Phase']].drop_duplicates()
+            if not phase_skip_alert_pairs.empty and phase_skip_waits is not None:
+                # Only read phase waits and cycle lengths for the alerting devices
+                alert_devices = phase_skip_alert_pairs['DeviceId'].unique().tolist()
+                self.phase_skip_waits = phase_skip_waits.filter(
+                    phase_skip_waits.DeviceId.isin(alert_devices)
+                ).execute()
+                self.cycle_length_data = cycle_length_data.filter(
+                    cycle_length_data.DeviceId.isin(alert_devices)
+                ).execute()
             if not phase_skip_alert_pairs.empty and not self.phase_skip_waits.empty:
-                annotated_phase_waits = self.phase_skip_waits.merge(
-                    phase_skip_alert_pairs.assign(AlertPhase=True),
-                    on=['DeviceId', 'Phase'],
-                    how='left'
+                # Flag alerting phases with a hash lookup instead of a left merge + fillna
+                alert_phase = pd.MultiIndex.from_frame(self.phase_skip_waits[['DeviceId', 'Phase']]).isin(
+                    pd.MultiIndex.from_frame(phase_skip_alert_pairs)
                 )
-                annotated_phase_waits['AlertPhase'] = annotated_phase_waits['AlertPhase'].fillna(False).astype(bool)
-                alert_devices = phase_skip_alert_pairs['DeviceId'].unique()
-                plot_phase_skip_waits = annotated_phase_waits[annotated_phase_waits['DeviceId'].isin(alert_devices)]
+                annotated_phase_waits = self.phase_skip_waits.assign(AlertPhase=alert_phase)
                 phase_skip_figures = create_phase_skip_plots(
-                    plot_phase_skip_waits, 
+                    annotated_phase_waits, 
                     signals, 
                     phase_skip_rankings, 
                     num_figures,
@@ -447,7 +568,7 @@ class ReportGenerator:
                 recent_new_alerts.get(alert_type, pd.DataFrame()),
                 past_alerts.get(alert_type, pd.DataFrame()),
                 alert_type,
-                self.config['alert_retention_weeks'],
+                retention_cutoff,
                 verbosity
             )
         
@@ -480,36 +601,37 @@ class ReportGenerator:
         )
         grouped['LatestDate'] = pd.to_datetime(grouped['LatestDate']).dt.normalize()
 
-        alerts = grouped[grouped['AggregatedSkips'] > threshold].copy()
+        alerts = grouped[grouped['AggregatedSkips'] > threshold]
         alerts = alerts.rename(columns={'LatestDate': 'Date'})
 
         return grouped, alerts.reindex(columns=PHASE_SKIP_ALERT_CANDIDATE_COLUMNS)
     
     def _suppress_alerts(self, new_alerts_df: pd.DataFrame, past_alerts_df: pd.DataFrame, 
-                         suppression_days: int, id_cols: list, verbosity: int) -> pd.DataFrame:
-        """Filters new alerts based on recent past alerts."""
-        if past_alerts_df.empty:
+                         cutoff_date: datetime, id_cols: list, verbosity: int) -> pd.DataFrame:
+        """Filters new alerts based on recent past alerts. Dates must already be normalized."""
+        if new_alerts_df.empty or past_alerts_df.empty:
             return new_alerts_df
 
-        cutoff_date = datetime.now() - timedelta(days=suppression_days)
-        
-        # Ensure dates are comparable (naive)
-        past_dates_naive = pd.to_datetime(past_alerts_df['Date']).dt.tz_localize(None)
-        cutoff_date_naive = cutoff_date.replace(tzinfo=None)
-
         # Filter past alerts to find recent ones
-        recent_past_alerts = past_alerts_df[past_dates_naive >= cutoff_date_naive]
+        recent_past_alerts = past_alerts_df[past_alerts_df['Date'] >= cutoff_date]
         
         if recent_past_alerts.empty:
             return new_alerts_df
 
-        # Get unique keys from recent alerts
-        suppression_keys = recent_past_alerts[id_cols].drop_duplicates()
-        log_message(f"Found {len(suppression_keys)} unique items for suppression based on the last {suppression_days} days.", 2, verbosity)
+        # Keys from recent alerts; isin hashes them itself, so only dedupe for the debug count.
+        # A single id column is matched directly, without building MultiIndex tuples.
+        if len(id_cols) == 1:
+            suppression_keys = recent_past_alerts[id_cols[0]]
+            new_keys = new_alerts_df[id_cols[0]]
+        else:
+            suppression_keys = pd.MultiIndex.from_frame(recent_past_alerts[id_cols])
+            new_keys = pd.MultiIndex.from_frame(new_alerts_df[id_cols])
+        if verbosity >= 2:
+            log_message(f"Found {suppression_keys.nunique()} unique items for suppression based on alerts since {cutoff_date:%Y-%m-%d}.", 2, verbosity)
 
-        # Perform suppression using merge
-        merged = new_alerts_df.merge(suppression_keys, on=id_cols, how='left', indicator=True)
-        suppressed_alerts_df = merged[merged['_merge'] == 'left_only'].drop(columns=['_merge'])
+        # Drop new alerts whose keys were alerted recently (hash lookup, no join frame)
+        is_suppressed = new_keys.isin(suppression_keys)
+        suppressed_alerts_df = new_alerts_df[~is_suppressed]
         
         num_suppressed = len(new_alerts_df) - len(suppressed_alerts_df)
         log_message(f"Suppressed {num_suppressed} new alerts.", 1, verbosity)
@@ -517,51 +639,54 @@ class ReportGenerator:
         return suppressed_alerts_df
     
     def _update_alert_history(self, new_alerts_df: pd.DataFrame, past_alerts_df: pd.DataFrame,
-                               alert_type: str, retention_weeks: int, verbosity: int) -> pd.DataFrame:
-        """Combines new and past alerts, applies retention, and returns updated history."""
+                               alert_type: str, retention_cutoff: Optional[datetime], verbosity: int) -> pd.DataFrame:
+        """Combines new and past alerts, applies retention, and returns updated history.
+
+        Both inputs are expected to carry a normalized Date column (see ``_normalize_date``).
+        Alerts older than retention_cutoff are dropped; None keeps the full history.
+        """
         config = ALERT_CONFIG[alert_type]
         id_cols = config['id_cols']
         required_cols = id_cols + ['Date']
 
+        if new_alerts_df.empty and past_alerts_df.empty:
+            log_message(f"Updated 0 '{alert_type}' alerts in history", 1, verbosity)
+            return pd.DataFrame(columns=required_cols)
+
         # Prepare new alerts
         if not new_alerts_df.empty:
-            new_alerts_to_save = new_alerts_df[required_cols].copy()
-            new_alerts_to_save['Date'] = pd.to_datetime(new_alerts_to_save['Date'])
+            new_alerts_to_save = new_alerts_df[required_cols]
         else:
             new_alerts_to_save = pd.DataFrame(columns=required_cols)
 
-        # Prepare past alerts
-        if not past_alerts_df.empty:
-            past_alerts_df = past_alerts_df[required_cols].copy()
-        else:
+        # Prepare past alerts (already projected to required_cols by _collect_past_alerts)
+        if past_alerts_df.empty:
             past_alerts_df = pd.DataFrame(columns=required_cols)
+        elif list(past_alerts_df.columns) != required_cols:
+            past_alerts_df = past_alerts_df[required_cols]
+
+        # Apply retention policy before combining so expired rows are never copied or hashed
+        if retention_cutoff is not None:
+            num_before = len(past_alerts_df) + len(new_alerts_to_save)
+            past_alerts_df = past_alerts_df[past_alerts_df['Date'] >= retention_cutoff]
+            new_alerts_to_save = new_alerts_to_save[new_alerts_to_save['Date'] >= retention_cutoff]
+            num_dropped = num_before - len(past_alerts_df) - len(new_alerts_to_save)
+            if num_dropped > 0:
+                log_message(f"Dropped {num_dropped} '{alert_type}' alerts due to retention policy (before {retention_cutoff:%Y-%m-%d}).", 1, verbosity)
 
         # Combine past and new alerts
         to_concat = [df for df in [past_alerts_df, new_alerts_to_save] if not df.empty]
-        if to_concat:
-            combined_alerts = pd.concat(to_concat, ignore_index=True)
+        if len(to_concat) > 1:
+            retained_alerts = pd.concat(to_concat, ignore_index=True)
+        elif to_concat:
+            retained_alerts = to_concat[0].reset_index(drop=True)
         else:
-            combined_alerts = pd.DataFrame(columns=required_cols)
+            retained_alerts = pd.DataFrame(columns=required_cols)
 
         # Drop duplicates
-        if not combined_alerts.empty:
-            combined_alerts.drop_duplicates(subset=required_cols, inplace=True)
-
-            # Apply retention policy
-            if retention_weeks > 0:
-                retention_cutoff = datetime.now() - timedelta(weeks=retention_weeks)
-                combined_dates_naive = pd.to_datetime(combined_alerts['Date']).dt.tz_localize(None)
-                retention_cutoff_naive = retention_cutoff.replace(tzinfo=None)
-                
-                retained_alerts = combined_alerts[combined_dates_naive >= retention_cutoff_naive]
-                num_dropped = len(combined_alerts) - len(retained_alerts)
-                if num_dropped > 0:
-                    log_message(f"Dropped {num_dropped} '{alert_type}' alerts due to retention policy ({retention_weeks} weeks).", 1, verbosity)
-            else:
-                retained_alerts = combined_alerts
-        else:
-            retained_alerts = combined_alerts
-            
+        if not retained_alerts.empty:
+            retained_alerts = retained_alerts.drop_duplicates(subset=required_cols)
+
         log_message(f"Updated {len(retained_alerts)} '{alert_type}' alerts in history", 1, verbosity)
         
         return retained_alerts
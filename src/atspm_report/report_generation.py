@@ -3,15 +3,19 @@ import importlib.resources
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, FrameBreak, KeepTogether
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, FrameBreak, KeepTogether
 from reportlab.platypus.flowables import Flowable
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfdoc, pdfmetrics
 from io import BytesIO
+from contextlib import contextmanager
 import matplotlib.pyplot as plt
 from datetime import datetime, date
 import os
 import calendar
+import zlib
 from pathlib import Path
 from typing import List, Tuple, Union, Dict, Any, Optional
 from .table_generation import (
@@ -38,6 +42,12 @@ def _load_jokes() -> list[str]:
 
 _JOKES = _load_jokes()
 
+# The header text never changes, so measure it once rather than on every report
+_TITLE_TEXT = "ATSPM Report"
+_TITLE_WIDTH = pdfmetrics.stringWidth(_TITLE_TEXT, "Helvetica-Bold", 24)
+_SUBTITLE_TEXT = "More Problems You Didn't Know You Had"
+_SUBTITLE_WIDTH = pdfmetrics.stringWidth(_SUBTITLE_TEXT, "Times-BoldItalic", 12)
+
 def get_joke(joke_index: int = None) -> str:
     """
     Get a joke for the report.
@@ -99,6 +109,32 @@ def get_signal_head_path() -> str:
         return None
 
 
+class _BinaryImageXObject(pdfdoc.PDFImageXObject):
+    """PDF image that stores its pixels as binary Flate data regardless of ``rl_config.useA85``.
+
+    Without ReportLab's optional C accelerator the ASCII85 encoder is pure Python, and it
+    inflates every embedded chart by a quarter. JPEG sources keep ReportLab's own handling.
+    """
+    def loadImageFromSRC(self, im):
+        if im.jpeg_fh():
+            return super().loadImageFromSRC(im)
+        self.width, self.height = im.getSize()
+        self.streamContent = zlib.compress(im.getRGBData())
+        self._filters = 'FlateDecode',
+        self.colorSpace = pdfdoc._mode2CS[im.mode]
+        self.bitsPerComponent = 8
+        self._checkTransparency(im)
+
+    def _checkTransparency(self, im):
+        if self.mask == 'auto' and im._dataA:
+            # Build the soft mask with this class too, so the alpha channel skips ASCII85 as well
+            self.mask = None
+            self._smask = _BinaryImageXObject(pdfdoc._digester(im._dataA.getRGBData()), im._dataA, mask=None)
+            self._smask._decode = [0, 1]
+        else:
+            super()._checkTransparency(im)
+
+
 class PageNumCanvas(canvas.Canvas):
     """Canvas that knows its page count for numbering"""
     def __init__(self, *args, **kwargs):
@@ -120,6 +156,36 @@ class PageNumCanvas(canvas.Canvas):
             canvas.Canvas.showPage(self)
         canvas.Canvas.save(self)
 
+    def drawImage(self, image, x, y, width=None, height=None, mask=None, **kwargs):
+        """Draw an image, embedding ImageReader pixels as binary rather than ASCII85 data.
+
+        The image object is registered under the same name ReportLab would give it, so the
+        base drawImage finds it and only places it on the page.
+        """
+        if isinstance(image, ImageReader):
+            # Same signature as ReportLab's; getRGBData must run first as it sets _dataA
+            rawdata = image.getRGBData()
+            smask = image._dataA
+            mdata = smask.getRGBData() if mask == 'auto' and smask else str(mask).encode('utf8')
+            name = pdfdoc._digester(rawdata + mdata)
+            reg_name = self._doc.getXObjectName(name)
+            if not self._doc.idToObject.get(reg_name):
+                img_obj = _BinaryImageXObject(name, image, mask=mask)
+                img_obj.name = name
+                self._setXObjects(img_obj)
+                self._doc.Reference(img_obj, reg_name)
+                self._doc.addForm(name, img_obj)
+                soft_mask = getattr(img_obj, '_smask', None)
+                if soft_mask:
+                    mask_reg_name = self._doc.getXObjectName(soft_mask.name)
+                    if not self._doc.idToObject.get(mask_reg_name):
+                        self._setXObjects(soft_mask)
+                        img_obj.smask = self._doc.Reference(soft_mask, mask_reg_name)
+                    else:
+                        img_obj.smask = pdfdoc.PDFObjectReference(mask_reg_name)
+                    del img_obj._smask
+        return canvas.Canvas.drawImage(self, image, x, y, width, height, mask, **kwargs)
+
     def set_footer_handler(self, handler):
         """Set the function that will draw the footer"""
         self._saved_footer_handler = handler
@@ -131,52 +197,59 @@ class HeaderFooter:
         self.logo_path = logo_path
         self.signal_head_path = signal_head_path
         self.region = region
+        # Read the header images once; every report drawn with this header reuses the decoded pixels
+        self._logo = self._load_image(logo_path, "Logo file", "logo")
+        self._signal_head = self._load_image(signal_head_path, "Signal image", "signal image")
+
+    @staticmethod
+    def _load_image(path: str, label: str, error_label: str) -> Optional[ImageReader]:
+        if not os.path.exists(path):
+            print(f"Warning: {label} not found at {path}")
+            return None
+        try:
+            return ImageReader(path)
+        except Exception as e:
+            print(f"Error loading {error_label}: {e}")
+            return None
 
     def draw_header(self, canvas, doc):
         """Draw the header on the first page"""
         # Logo on the left
         try:
-            if os.path.exists(self.logo_path):
-                canvas.drawImage(self.logo_path,
+            if self._logo is not None:
+                canvas.drawImage(self._logo,
                                doc.leftMargin,
                                doc.height + doc.topMargin - 0.7*inch,
                                width=1.8*inch,
                                height=0.7*inch,
                                preserveAspectRatio=True)
-            else:
-                print(f"Warning: Logo file not found at {self.logo_path}")
         except Exception as e:
             print(f"Error loading logo: {e}")
 
         # Title 
         canvas.setFont('Helvetica-Bold', 24)
         canvas.setFillColor(colors.black)
-        title_text = "ATSPM Report"
-        title_width = canvas.stringWidth(title_text, "Helvetica-Bold", 24)
+        title_width = _TITLE_WIDTH
         title_x = doc.width + doc.leftMargin - title_width - 0.5*inch  # Move title left to make room for icon
         canvas.drawString(title_x,
-                         doc.height + doc.topMargin - 0.3*inch, title_text)
+                         doc.height + doc.topMargin - 0.3*inch, _TITLE_TEXT)
 
         # Traffic light image - to the right of the title and higher up
         try:
-            if os.path.exists(self.signal_head_path):
-                canvas.drawImage(self.signal_head_path,
+            if self._signal_head is not None:
+                canvas.drawImage(self._signal_head,
                                title_x + title_width + 0.1*inch,  # Position right after title text
                                doc.height + doc.topMargin - 0.35*inch,  # Moved higher
                                width=0.35*inch,  # Slightly smaller
                                height=0.35*inch,  # Slightly smaller
                                preserveAspectRatio=True)
-            else:
-                print(f"Warning: Signal image not found at {self.signal_head_path}")
         except Exception as e:
             print(f"Error loading signal image: {e}")
 
         # Subtitle with bold and italic style - right aligned
         canvas.setFont('Times-BoldItalic', 12)
-        subtitle = "More Problems You Didn't Know You Had"
-        subtitle_width = canvas.stringWidth(subtitle, "Times-BoldItalic", 12)
-        canvas.drawString(doc.width + doc.leftMargin - subtitle_width,
-                         doc.height + doc.topMargin - 0.55*inch, subtitle)
+        canvas.drawString(doc.width + doc.leftMargin - _SUBTITLE_WIDTH,
+                         doc.height + doc.topMargin - 0.55*inch, _SUBTITLE_TEXT)
 
         # Draw horizontal line
         canvas.setStrokeColor(colors.black)
@@ -205,15 +278,15 @@ class MatplotlibFigure(Flowable):
 
     def draw(self):
         try:
-            # Create a BytesIO buffer and save the figure to it
-            buf = BytesIO()
-            self.figure.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-            buf.seek(0)
-
-            # Use ReportLab's canvas to draw the image
-            img = Image(buf, width=self.width, height=self.height)
-            img.drawOn(self.canv, 0, 0)
-            buf.close()
+            # ReportLab decodes the PNG and recompresses the raw pixels itself, so a
+            # light compression level only saves encode time; the PDF is unchanged
+            with BytesIO() as buf:
+                self.figure.savefig(buf, format='png', dpi=150, bbox_inches='tight',
+                                    pil_kwargs={'compress_level': 1})
+                buf.seek(0)
+                # Draw straight onto the canvas rather than through an Image flowable
+                self.canv.drawImage(ImageReader(buf), 0, 0, width=self.width, height=self.height,
+                                    mask='auto')
         except Exception as e:
             # If there's an error, print a message in the PDF
             self.canv.setFont('Helvetica', 12)
@@ -255,6 +328,14 @@ def draw_page_footer(canvas, page_num, num_pages, region=None):
     canvas.restoreState()
 
 
+def _figures_by_region(figures: Optional[List[tuple[plt.Figure, str]]]) -> Dict[str, List[plt.Figure]]:
+    """Group (figure, region) pairs by region, keeping the figures in their original order."""
+    by_region: Dict[str, List[plt.Figure]] = {}
+    for fig, region in figures or []:
+        by_region.setdefault(region, []).append(fig)
+    return by_region
+
+
 def generate_pdf_report(
         filtered_df_maxouts: pd.DataFrame, 
         filtered_df_actuations: pd.DataFrame,
@@ -304,17 +385,23 @@ def generate_pdf_report(
     Returns:
         Dict mapping region name to BytesIO containing PDF bytes
     """
+    # Group each figure collection by region once, rather than rescanning it for every region
+    phase_figures_by_region = _figures_by_region(phase_figures)
+    detector_figures_by_region = _figures_by_region(detector_figures)
+    ped_figures_by_region = _figures_by_region(ped_figures)
+    missing_data_figures_by_region = _figures_by_region(missing_data_figures)
+    phase_skip_figures_by_region = _figures_by_region(phase_skip_figures)
+
     # Get unique regions from figure collections and Phase Skip tables
-    figure_collections = [
-        phase_figures or [],
-        detector_figures or [],
-        ped_figures or [],
-        missing_data_figures or [],
-        phase_skip_figures or []
-    ]
     regions = set()
-    for collection in figure_collections:
-        regions.update(region for _, region in collection)
+    for figures_by_region in [
+        phase_figures_by_region,
+        detector_figures_by_region,
+        ped_figures_by_region,
+        missing_data_figures_by_region,
+        phase_skip_figures_by_region
+    ]:
+        regions.update(figures_by_region)
 
     if phase_skip_rows is not None and not phase_skip_rows.empty and signals_df is not None:
         region_lookup = (
@@ -347,29 +434,101 @@ def generate_pdf_report(
     joke_text = get_joke(joke_index)
     joke_title = "Joke of the Week"
 
+    # Paragraph styles are the same for every region, so build the stylesheet once
+    styles = getSampleStyleSheet()
+    styles['Title'].fontSize = 16
+    styles['Title'].spaceAfter = 12
+    styles['Title'].leading = 18
+
+    styles.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=8,
+        textColor=colors.navy
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SubsectionHeading',
+        parent=styles['Heading3'],
+        fontSize=12,
+        spaceAfter=6,
+        textColor=colors.navy
+    ))
+
+    # The header is the same on every region's first page, so its images are loaded once
+    logo_path = get_logo_path(custom_logo_path)
+    signal_head_path = get_signal_head_path()
+    header_footer = HeaderFooter(
+        logo_path=logo_path if logo_path else "",
+        signal_head_path=signal_head_path if signal_head_path else ""
+    )
+
+    # Split the signals and outages by region once instead of masking the full frames per region
+    signals_by_region = (
+        dict(tuple(signals_df.groupby('Region', sort=False))) if signals_df is not None else {}
+    )
+    outages_by_region = (
+        dict(tuple(system_outages_df.groupby('Region', sort=False))) if not system_outages_df.empty else {}
+    )
+
     # Process each individual region first
     for region in regions:
-        log_message(f"Generating report for {region}...", 1, verbosity)
         # Filter figures for this region
-        region_phase_figures = [fig for fig, reg in phase_figures if reg == region]
-        region_detector_figures = [fig for fig, reg in detector_figures if reg == region]
-        region_ped_figures = [fig for fig, reg in ped_figures if reg == region]
-        region_missing_data_figures = [fig for fig, reg in missing_data_figures if reg == region]
+        region_phase_figures = phase_figures_by_region.get(region, [])
+        region_detector_figures = detector_figures_by_region.get(region, [])
+        region_ped_figures = ped_figures_by_region.get(region, [])
+        region_missing_data_figures = missing_data_figures_by_region.get(region, [])
+        region_phase_skip_figures = phase_skip_figures_by_region.get(region, [])
+        if (
+            phase_skip_rows is not None and not phase_skip_rows.empty and
+            signals_df is not None and
+            allowed_phase_skip_pairs is not None and not allowed_phase_skip_pairs.empty
+        ):
+            region_phase_skip_rows, total_phase_skip_alerts = prepare_phase_skip_alerts_table(
+                phase_skip_rows,
+                signals_df,
+                region=region,
+                allowed_pairs=allowed_phase_skip_pairs,
+                min_total_skips=phase_skip_threshold if phase_skip_threshold is not None else 0,
+                max_rows=max_table_rows
+            )
+        else:
+            region_phase_skip_rows = pd.DataFrame()
+            total_phase_skip_alerts = 0
+
+        # Filter system outages for this region (or show all for "All Regions")
+        if region == "All Regions":
+            region_system_outages = system_outages_df if not system_outages_df.empty else pd.DataFrame()
+        else:
+            region_system_outages = (
+                outages_by_region.get(region, system_outages_df.iloc[0:0]) if not system_outages_df.empty else pd.DataFrame()
+            )
+
+        region_has_alerts = any([
+            region_phase_figures,
+            region_detector_figures,
+            region_ped_figures,
+            region_missing_data_figures,
+            region_phase_skip_figures,
+            not region_phase_skip_rows.empty,
+            not region_system_outages.empty
+        ])
+
+        # A region without alerts gets no report, so don't lay out and render one
+        if not region_has_alerts:
+            log_message(f"No alerts for {region}, skipping report.", 2, verbosity)
+            continue
+
+        log_message(f"Generating report for {region}...", 1, verbosity)
 
         # Filter signals
         if region == "All Regions":
             region_signals_df = signals_df
         else:
-            region_signals_df = signals_df[signals_df['Region'] == region] if signals_df is not None else None
-
-        # Create header/footer handler
-        logo_path = get_logo_path(custom_logo_path)
-        signal_head_path = get_signal_head_path()
-        header_footer = HeaderFooter(
-            logo_path=logo_path if logo_path else "",
-            signal_head_path=signal_head_path if signal_head_path else "",
-            region=region
-        )
+            region_signals_df = (
+                signals_by_region.get(region, signals_df.iloc[0:0]) if signals_df is not None else None
+            )
 
         # Create document with custom canvas
         def make_canvas(*args, **kwargs):
@@ -394,28 +553,6 @@ def generate_pdf_report(
         # Content building
         content = []
 
-        # Add report title and date
-        styles = getSampleStyleSheet()
-        styles['Title'].fontSize = 16
-        styles['Title'].spaceAfter = 12
-        styles['Title'].leading = 18
-        
-        styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=8,
-            textColor=colors.navy
-        ))
-        
-        styles.add(ParagraphStyle(
-            name='SubsectionHeading',
-            parent=styles['Heading3'],
-            fontSize=12,
-            spaceAfter=6,
-            textColor=colors.navy
-        ))
-
         # Add extra space after the header line
         content.append(Spacer(1, 0.3*inch))
 
@@ -473,24 +610,6 @@ def generate_pdf_report(
                 content.append(Spacer(1, 0.15*inch))
                 plt.close(fig)
 
-        region_phase_skip_figures = [fig for fig, reg in (phase_skip_figures or []) if reg == region]
-        if (
-            phase_skip_rows is not None and not phase_skip_rows.empty and
-            signals_df is not None and
-            allowed_phase_skip_pairs is not None and not allowed_phase_skip_pairs.empty
-        ):
-            region_phase_skip_rows, total_phase_skip_alerts = prepare_phase_skip_alerts_table(
-                phase_skip_rows,
-                signals_df,
-                region=region,
-                allowed_pairs=allowed_phase_skip_pairs,
-                min_total_skips=phase_skip_threshold if phase_skip_threshold is not None else 0,
-                max_rows=max_table_rows
-            )
-        else:
-            region_phase_skip_rows = pd.DataFrame()
-            total_phase_skip_alerts = 0
-
         if (region_phase_skip_rows is not None and not region_phase_skip_rows.empty) or region_phase_skip_figures:
             content.append(Paragraph("Phase Skip Alerts", styles['SectionHeading']))
             content.append(Spacer(1, 0.1*inch))
@@ -632,23 +751,9 @@ def generate_pdf_report(
                 chart_elements.append(MatplotlibFigure(fig, width=6.5*inch, height=2.8*inch))
                 content.append(KeepTogether(chart_elements))
                 content.append(Spacer(1, 0.15*inch))
-                plt.close(fig)        # Section: System Outages
-        # Filter system outages for this region (or show all for "All Regions")
-        if region == "All Regions":
-            region_system_outages = system_outages_df if not system_outages_df.empty else pd.DataFrame()
-        else:
-            region_system_outages = system_outages_df[system_outages_df['Region'] == region] if not system_outages_df.empty else pd.DataFrame()
+                plt.close(fig)
 
-        region_has_alerts = any([
-            region_phase_figures,
-            region_detector_figures,
-            region_ped_figures,
-            region_missing_data_figures,
-            region_phase_skip_figures,
-            not region_phase_skip_rows.empty,
-            not region_system_outages.empty
-        ])
-        
+        # Section: System Outages
         if not region_system_outages.empty:
             content.append(Paragraph("System-Wide Outages", styles['SectionHeading']))
             content.append(Spacer(1, 0.1*inch))
@@ -681,9 +786,20 @@ def generate_pdf_report(
                  onLaterPages=header_footer.laterPages,
                  canvasmaker=make_canvas)
         
-        if region_has_alerts:
-            buffer_objects.append((region, buffer))
-            log_message(f"Report for {region} generated in memory.", 1, verbosity)
+        buffer_objects.append((region, buffer))
+        log_message(f"Report for {region} generated in memory.", 1, verbosity)
+
+    # Close any figure whose section was never laid out so pyplot doesn't keep it alive
+    for figures_by_region in [
+        phase_figures_by_region,
+        detector_figures_by_region,
+        ped_figures_by_region,
+        missing_data_figures_by_region,
+        phase_skip_figures_by_region
+    ]:
+        for region_figures in figures_by_region.values():
+            for fig in region_figures:
+                plt.close(fig)
 
     # Return dict mapping region name to BytesIO
     return {region: buf for region, buf in buffer_objects}
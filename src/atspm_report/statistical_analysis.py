@@ -2,8 +2,6 @@ import ibis
 
 def cusum(df, k_value=0.5, forgetfulness=2):
     """Calculate CUSUM statistics for anomaly detection"""
-    ibis.options.interactive = True
-    
     # Create ibis table from dataframe
     table = ibis.memtable(df)
 
@@ -23,64 +21,34 @@ def cusum(df, k_value=0.5, forgetfulness=2):
     else:
         raise ValueError("Unknown data format for CUSUM analysis")
 
-    # Calculate group-based metrics
-    if group_column:
-        group_metrics = table.group_by(['DeviceId', group_column]).aggregate(
-            _MinDate=table['Date'].min(),
-            _MaxDate=table['Date'].max(),
-            _Average=table[column].mean(),
-            _StdDev=table[column].std()
-        )
-        # Join the metrics back to the original table
-        joined = table.join(group_metrics, ['DeviceId', group_column])
-        # Set up window for calculations
-        window = ibis.window(
-            group_by=['DeviceId', group_column],
-            order_by=['Date'],
-            preceding=ibis.interval(days=6),
-            following=0
-        )
-    else:
-        # For missing data (no group_column)
-        group_metrics = table.group_by(['DeviceId']).aggregate(
-            _MinDate=table['Date'].min(),
-            _MaxDate=table['Date'].max(),
-            _Average=table[column].mean(),
-            _StdDev=table[column].std()
-        )
-        # Join the metrics back to the original table
-        joined = table.join(group_metrics, ['DeviceId'])
-        # Set up window for calculations
-        window = ibis.window(
-            group_by=['DeviceId'],
-            order_by=['Date'],
-            preceding=ibis.interval(days=6),
-            following=0
-        )
-
-    # Add date weight column
-    result = joined.mutate(
-        DateWeight=(joined['Date'].delta(joined['_MinDate'], unit='days') + 1)**forgetfulness,
-    )
-    # Add Date Weight Sum
-    result = result.mutate(
-        DateWeightSum=result['DateWeight'].sum().over(window),
+    # Calculate group-based metrics as partition windows rather than group_by + join,
+    # so the backend reuses one partitioned sort instead of hashing the table twice
+    group_keys = ['DeviceId', group_column] if group_column else ['DeviceId']
+    group = ibis.window(group_by=group_keys)
+    joined = table.mutate(
+        _MinDate=table['Date'].min().over(group),
+        _MaxDate=table['Date'].max().over(group),
+        _Average=table[column].mean().over(group),
+        _StdDev=table[column].std().over(group)
     )
-    result = result.mutate(
-        DaySum=ibis.greatest(0, result[column] - result['_Average'] - k_value * result['_StdDev']) *
-                result['DateWeight']
+    # Set up window for calculations
+    window = ibis.window(
+        group_by=group_keys,
+        order_by=['Date'],
+        preceding=ibis.interval(days=6),
+        following=0
     )
 
+    # Weight recent days more heavily, then take both weighted window sums in a single
+    # projection so they share one partitioned sort
+    date_weight = (joined['Date'].delta(joined['_MinDate'], unit='days') + 1)**forgetfulness
+    day_sum = ibis.greatest(0, joined[column] - joined['_Average'] - k_value * joined['_StdDev']) * date_weight
+
     # Use the dynamic column name here
-    result = result.mutate(**{
-        cusum_column_name: result['DaySum'].sum().over(window) / result['DateWeightSum'] * 7
+    result = joined.mutate(**{
+        cusum_column_name: day_sum.sum().over(window) / date_weight.sum().over(window) * 7
     })
 
-    # Drop everything but the CUSUM column
-    result = result.drop(
-        ['DateWeight', 'DateWeightSum', 'DaySum']
-    )
-
     return result
 
 def alert(table):
@@ -100,76 +68,42 @@ def alert(table):
     else:
         raise ValueError("Unknown data format for alert generation")
 
-    # Add z-score column
-    result = table.mutate(
-        z_score=(table[column] - table['_Average']) / table['_StdDev']
-    )
+    # Build the z-score, alert flag and date offset as expressions and add them in one projection
+    z_score = (table[column] - table['_Average']) / table['_StdDev']
 
     if 'Percent MaxOut' in table.columns:
         # Include Services in alert conditions for Percent MaxOut
-        result = result.mutate(
-            Alert=(
-                (result[cusum_column_name] > 0.25) &
-                (result['Services'] > 30) &
-                (result['z_score'] > 4) &
-                (result[column] > 0.2)
-            ).cast('int32')  # Convert boolean to 0/1
+        is_alert = (
+            (table[cusum_column_name] > 0.25) &
+            (table['Services'] > 30) &
+            (z_score > 4) &
+            (table[column] > 0.2)
         )
     elif 'PercentAnomalous' in table.columns:
         # Alert condition for PercentAnomalous
-        result = result.mutate(
-            Alert=(
-                (result[cusum_column_name] > 0.20) &
-                (result['z_score'] > 3.5) &
-                (result[column] > 0.10)
-            ).cast('int32')  # Convert boolean to 0/1
+        is_alert = (
+            (table[cusum_column_name] > 0.20) &
+            (z_score > 3.5) &
+            (table[column] > 0.10)
         )
     else:
         # Alert condition for MissingData
-        result = result.mutate(
-            Alert=(
-                (result[cusum_column_name] > 0.1) &
-                (result['z_score'] > 3) &
-                (result[column] > 0.05) 
-            ).cast('int32')  # Convert boolean to 0/1
+        is_alert = (
+            (table[cusum_column_name] > 0.1) &
+            (z_score > 3) &
+            (table[column] > 0.05)
         )
 
-    # Calculate days from max date for each row
-    result = result.mutate(
-        days_from_max=result['Date'].delta(result['_MaxDate'], unit='days').abs(),
+    result = table.mutate(
+        z_score=z_score,
+        Alert=is_alert.cast('int32'),  # Convert boolean to 0/1
+        days_from_max=table['Date'].delta(table['_MaxDate'], unit='days').abs(),
     )
 
-    # Find DeviceId/Group pairs that have alerts within the last week
-    if group_column:
-        alert_pairs = (
-            result.filter(
-                (result['Alert'] == 1) &
-                (result['days_from_max'] <= 6)  # Within last week (0 to 6 days)
-            )
-            .select('DeviceId', group_column)
-            .distinct()
-        )
-
-        # Join back to get all records for these DeviceId/Group pairs
-        final_result = result.semi_join(
-            alert_pairs,
-            ['DeviceId', group_column]
-        )
-    else:
-        # For missing data (no group_column)
-        alert_devices = (
-            result.filter(
-                (result['Alert'] == 1) &
-                (result['days_from_max'] <= 6)  # Within last week (0 to 6 days)
-            )
-            .select('DeviceId')
-            .distinct()
-        )
-
-        # Join back to get all records for these DeviceId
-        final_result = result.semi_join(
-            alert_devices,
-            ['DeviceId']
-        )
+    # Keep every record for DeviceId/Group pairs that have an alert within the last week.
+    # A window over each pair flags them in the same pass instead of a distinct + semi join.
+    pair_keys = ['DeviceId', group_column] if group_column else ['DeviceId']
+    recent_alert = (result['Alert'] == 1) & (result['days_from_max'] <= 6)  # Within last week (0 to 6 days)
+    final_result = result.filter(recent_alert.any().over(group_by=pair_keys))
 
     return final_result
\ No newline at end of file
@@ -21,6 +21,14 @@ def _format_phase_skip_time_axis(ax: 'plt.Axes', timestamps: 'pd.Series') -> Non
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
 
+
+def _rows_by_device(df: 'pd.DataFrame') -> Tuple[dict, 'pd.DataFrame']:
+    """Split a frame into per-device slices once so each chart is a dict lookup, not a full scan.
+
+    Returns the slices keyed by DeviceId and an empty frame with the same columns for misses.
+    """
+    return dict(tuple(df.groupby('DeviceId', sort=False))), df.iloc[0:0]
+
 def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', num_figures: int, 
                         df_hourly: Optional['pd.DataFrame'] = None) -> List[Tuple['plt.Figure', str]]:
     """Generate plots for each device's data
@@ -104,10 +112,16 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
     figures = []  # Store figures for PDF generation
     figures_with_rank = []  # Store figures with ranking information for sorting
 
+    # Devices appear in their own region and again under "All Regions", so slice by device once.
+    # Missing data is drawn as one chart per region and never looks rows up by device.
+    if 'MissingData' not in df_daily.columns:
+        daily_by_device, no_daily = _rows_by_device(df_daily)
+        if df_hourly is not None:
+            hourly_by_device, no_hourly = _rows_by_device(df_hourly)
+
     # Process each region separately
     regions = list(signals_df['Region'].unique())
     regions.append('All Regions')  # Append "All" as an additional region
-    print(f'Making visuals for {len(regions)} regions: {regions}')
     
     for region in regions:
         if region == "All Regions":
@@ -231,7 +245,7 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
                 name = device_info['Name']
                 
                 # Filter hourly data for this device
-                plot_data = df_hourly[df_hourly['DeviceId'] == device].copy()
+                plot_data = hourly_by_device.get(device, no_hourly).copy()
                 time_column = 'TimeStamp'
                 
                 # Skip if no data
@@ -245,7 +259,7 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
                 )
                 
                 # Identify phases with alerts from daily data
-                device_daily = region_data[region_data['DeviceId'] == device]
+                device_daily = daily_by_device.get(device, no_daily)
                 alert_phases = set(device_daily['Phase'].unique())  # All phases in alerts df have alerts
                 
                 # Create the plot with a bigger figure size for better readability
@@ -375,14 +389,14 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
             # Determine which dataset to use for plotting
             if df_hourly is not None:
                 # Use hourly data for plotting
-                plot_data = df_hourly[df_hourly['DeviceId'] == device]
+                plot_data = hourly_by_device.get(device, no_hourly)
                 time_column = 'TimeStamp'
                 # Set the correct y-label for hourly data if it's detector health
                 if 'PercentAnomalous' in df_daily.columns:
                     y_label = y_label_hourly
             else:
                 # Use daily data for plotting
-                plot_data = df_daily[df_daily['DeviceId'] == device]
+                plot_data = daily_by_device.get(device, no_daily)
                 time_column = 'Date'
                 # Set the correct y-label for daily data if it's detector health
                 if 'PercentAnomalous' in df_daily.columns:
@@ -399,7 +413,7 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
                 # For detector health, filter detectors differently based on if using hourly data
                 if df_hourly is not None and 'PercentAnomalous' in df_daily.columns:
                     # For hourly detector health charts, identify detectors in daily data
-                    daily_data = df_daily[df_daily['DeviceId'] == device]
+                    daily_data = daily_by_device.get(device, no_daily)
                     detectors_in_daily = set(daily_data[group_column].unique())
                     
                     # Get all detectors in hourly data
@@ -451,7 +465,7 @@ def create_device_plots(df_daily: 'pd.DataFrame', signals_df: 'pd.DataFrame', nu
                     # For phase termination plots, apply the same gray treatment as detector health
                     if group_column == 'Phase' and 'Percent MaxOut' in df_daily.columns:
                         # For phase termination charts, identify phases with alerts in daily data
-                        daily_data = df_daily[df_daily['DeviceId'] == device]
+                        daily_data = daily_by_device.get(device, no_daily)
                         phases_with_alerts = set(daily_data[daily_data['Alert'] == 1][group_column].unique())
                         
                         # Get all phases in hourly/plot data
@@ -655,6 +669,10 @@ def create_phase_skip_plots(
     # Same color palette as the other charts
     colors = ['#E41A1C', '#377EB8', '#4DAF4A', '#984EA3', '#FF7F00', '#A65628', '#F781BF', '#17BECF']
 
+    waits_by_device, no_waits = _rows_by_device(phase_waits_df)
+    if cycle_length_df is not None and not cycle_length_df.empty:
+        cycles_by_device, no_cycles = _rows_by_device(cycle_length_df)
+
     for region in regions:
         if region == 'All Regions':
             region_rankings = rankings
@@ -672,7 +690,7 @@ def create_phase_skip_plots(
 
         for _, device_row in top_devices.iterrows():
             device_id = device_row['DeviceId']
-            device_data = phase_waits_df[phase_waits_df['DeviceId'] == device_id]
+            device_data = waits_by_device.get(device_id, no_waits)
 
             if device_data.empty:
                 continue
@@ -719,7 +737,7 @@ def create_phase_skip_plots(
 
             # Plot cycle length as a step function if data is available
             if cycle_length_df is not None and not cycle_length_df.empty:
-                device_cycle_data = cycle_length_df[cycle_length_df['DeviceId'] == device_id].copy()
+                device_cycle_data = cycles_by_device.get(device_id, no_cycles)
                 if not device_cycle_data.empty:
                     device_cycle_data = device_cycle_data.sort_values('TimeStamp')
                     # Use step function with 'post' to step up/down at the exact time of change
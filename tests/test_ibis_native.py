@@ -198,6 +198,45 @@ class TestIbisEndToEnd(unittest.TestCase):
                     f"{alert_type}: DeviceId mismatch between Ibis and pandas"
                 )
     
+    def test_ibis_past_alerts_suppress_alerts(self):
+        """Test that past alerts passed as Ibis tables suppress repeat alerts."""
+        import tempfile
+        from pathlib import Path
+        from atspm_report import ReportGenerator
+
+        generator = ReportGenerator(self.config)
+        first = generator.generate(
+            signals=self.signals_pd,
+            terminations=self.terminations_pd,
+            detector_health=self.detector_health_pd,
+            has_data=self.has_data_pd,
+            pedestrian=self.pedestrian_pd
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            past_alerts = {}
+            for alert_type, df in first['updated_past_alerts'].items():
+                if df.empty:
+                    continue
+                path = Path(tmp_dir) / f'past_{alert_type}_alerts.parquet'
+                # Extra columns should be ignored when reading the history
+                df.assign(Extra=1).to_parquet(path, index=False)
+                past_alerts[alert_type] = self.con.read_parquet(str(path))
+
+            second = generator.generate(
+                signals=self.signals_pd,
+                terminations=self.terminations_pd,
+                detector_health=self.detector_health_pd,
+                has_data=self.has_data_pd,
+                pedestrian=self.pedestrian_pd,
+                past_alerts=past_alerts
+            )
+
+        for alert_type, df in second['alerts'].items():
+            self.assertTrue(df.empty, f"Alert type {alert_type} was not suppressed: {df}")
+        for alert_type, df in second['updated_past_alerts'].items():
+            self.assertNotIn('Extra', df.columns)
+
     def test_ibis_generates_pdf_reports(self):
         """Test that Ibis input generates PDF reports when alerts exist.
         
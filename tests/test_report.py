@@ -259,6 +259,131 @@ class TestReportGenerator(unittest.TestCase):
         )
         self.assertIn('reports', result)
 
+    def test_6_regions_without_alerts_get_no_report(self):
+        """Regions with nothing to show should be skipped rather than built and discarded."""
+        from atspm_report.report_generation import generate_pdf_report
+
+        empty = pd.DataFrame()
+        with patch("atspm_report.report_generation.SimpleDocTemplate") as doc_template:
+            reports = generate_pdf_report(
+                filtered_df_maxouts=empty,
+                filtered_df_actuations=empty,
+                filtered_df_ped=empty,
+                ped_hourly_df=empty,
+                filtered_df_missing_data=empty,
+                system_outages_df=empty,
+                phase_figures=[],
+                detector_figures=[],
+                ped_figures=[],
+                missing_data_figures=[],
+                signals_df=self.subset_signals,
+                verbosity=0
+            )
+
+        self.assertEqual(reports, {})
+        doc_template.assert_not_called()
+
+    def test_7_unused_figures_are_closed(self):
+        """Figures whose section is never laid out should still be released from pyplot."""
+        import matplotlib.pyplot as plt
+        from atspm_report.report_generation import generate_pdf_report
+
+        empty = pd.DataFrame()
+        region = self.subset_signals['Region'].iloc[0]
+        fig = plt.figure()
+        with patch("atspm_report.report_generation.SimpleDocTemplate"):
+            generate_pdf_report(
+                filtered_df_maxouts=empty,
+                filtered_df_actuations=empty,
+                filtered_df_ped=empty,
+                ped_hourly_df=empty,
+                filtered_df_missing_data=empty,
+                system_outages_df=empty,
+                phase_figures=[(fig, region)],
+                detector_figures=[],
+                ped_figures=[],
+                missing_data_figures=[],
+                signals_df=self.subset_signals,
+                verbosity=0
+            )
+
+        self.assertFalse(plt.fignum_exists(fig.number))
+
+    def test_8_charts_embed_as_binary_without_global_changes(self):
+        """Charts skip ASCII85 on the report canvas while ReportLab's global setting is untouched."""
+        import matplotlib.pyplot as plt
+        from reportlab import rl_config
+        from reportlab.lib.utils import ImageReader
+        from atspm_report.report_generation import PageNumCanvas
+
+        fig = plt.figure(figsize=(1, 1))
+        png = BytesIO()
+        fig.savefig(png, format='png')
+        plt.close(fig)
+        png.seek(0)
+
+        use_a85 = rl_config.useA85
+        pdf = BytesIO()
+        c = PageNumCanvas(pdf)
+        c.drawImage(ImageReader(png), 0, 0, width=72, height=72, mask='auto')
+        c.showPage()
+        c.save()
+
+        self.assertEqual(rl_config.useA85, use_a85)
+        image_dicts = re.findall(rb'<<[^>]*?/Subtype /Image[^>]*?>>', pdf.getvalue())
+        self.assertTrue(image_dicts)
+        for image_dict in image_dicts:
+            self.assertNotIn(b'ASCII85Decode', image_dict)
+
+
+class TestAlertSuppression(unittest.TestCase):
+    """Test suppression of new alerts against recent past alerts."""
+
+    def setUp(self):
+        self.generator = ReportGenerator({"verbosity": 0})
+        today = pd.Timestamp(datetime.now().date())
+        self.cutoff = datetime.now() - timedelta(days=21)
+        self.new_alerts = pd.DataFrame({
+            'DeviceId': ['1', '1', '2'],
+            'Phase': [2, 4, 2],
+            'Date': [today] * 3,
+        })
+        self.past_alerts = pd.DataFrame({
+            'DeviceId': ['1', '2'],
+            'Phase': [2, 2],
+            'Date': [today - pd.Timedelta(days=3), today - pd.Timedelta(days=60)],
+        })
+
+    def test_only_recent_matching_keys_are_suppressed(self):
+        result = self.generator._suppress_alerts(
+            self.new_alerts, self.past_alerts, self.cutoff, ['DeviceId', 'Phase'], 0
+        )
+        self.assertEqual(
+            list(result[['DeviceId', 'Phase']].itertuples(index=False, name=None)),
+            [('1', 4), ('2', 2)]
+        )
+
+    def test_single_id_column(self):
+        result = self.generator._suppress_alerts(
+            self.new_alerts, self.past_alerts, self.cutoff, ['DeviceId'], 0
+        )
+        self.assertEqual(result['DeviceId'].tolist(), ['2'])
+
+    def test_history_drops_expired_and_duplicate_rows(self):
+        history = self.generator._update_alert_history(
+            self.new_alerts, pd.concat([self.past_alerts, self.new_alerts]), 'maxout',
+            datetime.now() - timedelta(weeks=4), 0
+        )
+        self.assertEqual(len(history), 4)
+        self.assertFalse(history.duplicated().any())
+
+    def test_normalize_date_strips_timezone(self):
+        from atspm_report.generator import _normalize_date
+        past = self.past_alerts.assign(Date=self.past_alerts['Date'].dt.tz_localize('UTC'))
+        normalized = _normalize_date(past)
+        self.assertIsNone(normalized['Date'].dt.tz)
+        self.assertIs(_normalize_date(normalized), normalized)
+
 
 class TestPackageMetadata(unittest.TestCase):
     """Test package metadata and configuration."""